@@ -1,6 +1,10 @@
 import logging
+import textwrap
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
@@ -9,6 +13,54 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory, CandlesConfig
 from hummingbot.connector.connector_base import ConnectorBase
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, the kernels below also run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _sma(close, length):
+    out = np.full(close.shape[0], np.nan)
+    window_sum = 0.0
+    for i in range(close.shape[0]):
+        window_sum += close[i]
+        if i >= length:
+            window_sum -= close[i - length]
+        if i >= length - 1:
+            out[i] = window_sum / length
+    return out
+
+
+@njit(cache=True)
+def _rsi(close, length):
+    # Same definition as pandas_ta.rsi: gains and losses are each smoothed with an adjusted EWM
+    # (alpha = 1 / length), so the shared normalising weight cancels out of gains / (gains + losses)
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / length
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain_sum = gain_sum * decay + (change if change > 0.0 else 0.0)
+        loss_sum = loss_sum * decay + (-change if change < 0.0 else 0.0)
+        # pandas_ta leaves 0 / 0 (flat prices) as NaN
+        if i >= length and gain_sum + loss_sum > 0.0:
+            out[i] = 100.0 * gain_sum / (gain_sum + loss_sum)
+    return out
+
+
+class CandleFeatures(NamedTuple):
+    candles_df: pd.DataFrame
+    rsi: np.ndarray
+    sma: np.ndarray
+
+
 class PMMCandles(ScriptStrategyBase):
     """
      Simple PMM with added Risk Managements
@@ -17,17 +69,23 @@ class PMMCandles(ScriptStrategyBase):
     bid_spread = Decimal('0.0001')
     ask_spread = Decimal('0.0001')
     order_refresh_time = 15
+    status_cache_ttl = 1
     base_order_amount = Decimal('0.01')
     create_timestamp = 0
     trading_pair = "ETH-USDT"
     exchange = "binance_paper_trade"
     price_source = PriceType.MidPrice
 
+    _ONE = Decimal('1')
+    _PCT = Decimal('0.01')
+    _SIGN = {TradeType.SELL: Decimal(1), TradeType.BUY: Decimal(-1)}
+
     # Candles configuration
     candle_exchange = "binance"
     candles_interval = "1m"
     candles_length = 30
-    max_records = 1000
+    # Indicators use the last candles_length * 4 rows (display plus warmup); the rest is headroom, with a floor of 200
+    max_records = max(candles_length * 5, 200)
 
     candles = CandlesFactory.get_candle(
         CandlesConfig(
@@ -42,10 +100,30 @@ class PMMCandles(ScriptStrategyBase):
 
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         super().__init__(connectors)
+        self._connector = self.connectors[self.exchange]
         self.candles.start()
         self.min_spread = Decimal('0.0001')
         self.max_spread = Decimal('0.0010')
         self.total_profit = Decimal('0')
+        self.base_asset, self.quote_asset = self.trading_pair.split("-")
+        self._feat_cache = (None, None)
+        self._status_cache = {}
+        self._buy_template = OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal(0),
+            price=Decimal(0)
+        )
+        self._sell_template = OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.SELL,
+            amount=Decimal(0),
+            price=Decimal(0)
+        )
         self.logger().info("Strategy initialized")
 
     def on_stop(self):
@@ -53,109 +131,120 @@ class PMMCandles(ScriptStrategyBase):
         self.logger().info("Strategy stopped")
 
     def on_tick(self):
+        # Proposals are built on the tick thread: connectors and the candles feed are not thread-safe
         if self.create_timestamp <= self.current_timestamp:
             self.cancel_all_orders()
-            proposal = self.create_proposal()
+            ref_price, proposal = self.create_proposal()
             if proposal:
                 proposal_adjusted = self.adjust_proposal_to_budget(proposal)
                 if proposal_adjusted:
-                    self.place_orders(proposal_adjusted)
+                    self.place_orders(proposal_adjusted, ref_price)
             self.create_timestamp = self.order_refresh_time + self.current_timestamp
 
-    def get_candles_with_features(self):
+    def get_candles_with_features(self) -> Optional[CandleFeatures]:
         if not self.candles.ready:
             return None
-        candles_df = self.candles.candles_df
-        candles_df.ta.rsi(length=self.candles_length, append=True)
-        candles_df.ta.sma(length=self.candles_length, append=True)
-        return candles_df
+        # Features only change when the newest candle changes, so reuse them between status refreshes.
+        # The key is the feed's whole raw last row, so a hit never builds the DataFrame, and any update to the
+        # live candle (prices, volumes, trade count) invalidates it since every column is displayed.
+        cache_key = tuple(self.candles._candles[-1])
+        cached_key, cached_features = self._feat_cache
+        if cache_key == cached_key:
+            return cached_features
+        raw_df = self.candles.candles_df
+        # Only the last candles_length rows are displayed, so keep just enough history for indicator warmup
+        tail_df = raw_df.tail(self.candles_length * 4)
+        close = tail_df["close"].to_numpy(dtype=np.float64)
+        rsi = _rsi(close, self.candles_length)
+        sma = _sma(close, self.candles_length)
+        features = CandleFeatures(
+            candles_df=tail_df,
+            rsi=rsi,
+            sma=sma
+        )
+        self._feat_cache = (cache_key, features)
+        return features
 
-    def create_proposal(self) -> List[OrderCandidate]:
+    def create_proposal(self) -> Tuple[Optional[Decimal], List[OrderCandidate]]:
         if not self.candles.ready:
             self.logger().warning("Candles not ready")
-            return []
+            return None, []
 
         try:
-            ref_price = self.connectors[self.exchange].get_price_by_type(self.trading_pair, self.price_source)
+            ref_price = self._connector.get_price_by_type(self.trading_pair, self.price_source)
             if not ref_price:
                 self.logger().warning("No reference price")
-                return []
+                return None, []
+
+            ref_price_d = Decimal(str(ref_price))
 
             # Get available balance
-            quote_asset = self.trading_pair.split("-")[1]
-            base_asset = self.trading_pair.split("-")[0]
-            quote_balance = self.connectors[self.exchange].get_available_balance(quote_asset)
-            base_balance = self.connectors[self.exchange].get_available_balance(base_asset)
-
-            # Calculates dynamic spread based on recent volatility
-            candles_df = self.candles.candles_df
-            recent_high = Decimal(str(candles_df["high"].iloc[-1]))
-            recent_low = Decimal(str(candles_df["low"].iloc[-1]))
-            recent_range = (recent_high - recent_low) / Decimal(str(ref_price))
-            dynamic_spread = min(self.max_spread, max(self.min_spread, recent_range * Decimal('0.5')))
+            quote_balance = self._connector.get_available_balance(self.quote_asset)
+            base_balance = self._connector.get_available_balance(self.base_asset)
+            quote_balance_d = Decimal(str(quote_balance))
+            base_balance_d = Decimal(str(base_balance))
+
+            # Calculates dynamic spread based on recent volatility, in float since the result is clamped to
+            # [min_spread, max_spread]. High/low come from the feed's raw last row
+            # [timestamp, open, high, low, close, ...] so no DataFrame is built per tick.
+            last_candle = self.candles._candles[-1]
+            recent_range = (float(last_candle[2]) - float(last_candle[3])) / float(ref_price)
+            spread = max(float(self.min_spread), min(float(self.max_spread), recent_range * 0.5))
+            dynamic_spread = Decimal(f"{spread:.8f}")
 
             # Calculates order amounts (1% of available balance or base amount)
             buy_amount = min(
                 self.base_order_amount,
-                (Decimal(str(quote_balance)) * Decimal('0.01')) / Decimal(str(ref_price))
+                (quote_balance_d * self._PCT) / ref_price_d
             )
             sell_amount = min(
                 self.base_order_amount,
-                Decimal(str(base_balance)) * Decimal('0.01')
+                base_balance_d * self._PCT
             )
 
             # Calculates prices
-            buy_price = Decimal(str(ref_price)) * (Decimal('1') - dynamic_spread)
-            sell_price = Decimal(str(ref_price)) * (Decimal('1') + dynamic_spread)
-
-            # Creates orders
-            buy_order = OrderCandidate(
-                trading_pair=self.trading_pair,
-                is_maker=True,
-                order_type=OrderType.LIMIT,
-                order_side=TradeType.BUY,
-                amount=buy_amount,
-                price=buy_price
-            )
+            one_minus = self._ONE - dynamic_spread
+            one_plus = self._ONE + dynamic_spread
+            buy_price = ref_price_d * one_minus
+            sell_price = ref_price_d * one_plus
 
-            sell_order = OrderCandidate(
-                trading_pair=self.trading_pair,
-                is_maker=True,
-                order_type=OrderType.LIMIT,
-                order_side=TradeType.SELL,
-                amount=sell_amount,
-                price=sell_price
-            )
+            # Updates the preallocated orders (the budget checker works on copies, so reusing them is safe)
+            self._buy_template.amount = buy_amount
+            self._buy_template.price = buy_price
+            self._sell_template.amount = sell_amount
+            self._sell_template.price = sell_price
 
-            return [buy_order, sell_order]
+            return ref_price_d, [self._buy_template, self._sell_template]
         # proposals exception handling 
         except Exception as e:
-            self.logger().error(f"Error creating proposal: {e}", exc_info=True)
-            return []
+            self.logger().error(f"Error creating proposal: {e}")
+            return None, []
 
     def adjust_proposal_to_budget(self, proposal: List[OrderCandidate]) -> List[OrderCandidate]:
         try:
-            return self.connectors[self.exchange].budget_checker.adjust_candidates(proposal, all_or_none=True)
+            return self._connector.budget_checker.adjust_candidates(proposal, all_or_none=True)
         except Exception as e:
-            self.logger().error(f"Budget adjustment failed: {e}", exc_info=True)
+            self.logger().error(f"Budget adjustment failed: {e}")
             return []
 
-    def place_orders(self, proposal: List[OrderCandidate]) -> None:
+    def place_orders(self, proposal: List[OrderCandidate], ref_price: Decimal) -> None:
+        # Both sides are priced around ref_price, so against it the profit is always ref_price * spread > 0.
+        # Only drift since the proposal was built can flip a side, so check both against one fresh mid price.
+        try:
+            mid_price = self._connector.get_price_by_type(self.trading_pair, self.price_source)
+            mid_price = Decimal(str(mid_price)) if mid_price else ref_price
+        except Exception as e:
+            self.logger().error(f"Mid price lookup failed, checking against ref price: {e}")
+            mid_price = ref_price
         for order in proposal:
-            if self.calculate_expected_profit(order) > Decimal('0'):
+            if self.calculate_expected_profit(order, mid_price) > Decimal('0'):
                 self.place_order(connector_name=self.exchange, order=order)
 
-    def calculate_expected_profit(self, order: OrderCandidate) -> Decimal:
+    def calculate_expected_profit(self, order: OrderCandidate, mid_price: Decimal) -> Decimal:
         try:
-            mid_price = Decimal(str(self.connectors[self.exchange].get_price_by_type(
-                self.trading_pair, PriceType.MidPrice
-            )))
-            if order.order_side == TradeType.SELL:
-                return Decimal(str(order.price)) - mid_price
-            else:
-                return mid_price - Decimal(str(order.price))
+            return self._SIGN[order.order_side] * (order.price - mid_price)
         except Exception as e:
-            self.logger().error(f"Profit calculation failed: {e}", exc_info=True)
+            self.logger().error(f"Profit calculation failed: {e}")
             return Decimal('0')
 
     def place_order(self, connector_name: str, order: OrderCandidate):
@@ -179,14 +268,16 @@ class PMMCandles(ScriptStrategyBase):
                 )
                 self.logger().info(f"Placed SELL order: {order.amount} at {order.price}")
         except Exception as e:
-            self.logger().error(f"Order placement failed: {e}", exc_info=True)
+            self.logger().error(f"Order placement failed: {e}")
 
     def cancel_all_orders(self):
+        # self.cancel only schedules the cancel request, so this loop does not wait on a round trip per order.
+        # connector.cancel_all is not used: it runs after on_tick returns and would also cancel the new proposal.
         try:
             for order in self.get_active_orders(connector_name=self.exchange):
                 self.cancel(self.exchange, order.trading_pair, order.client_order_id)
         except Exception as e:
-            self.logger().error(f"Order cancellation failed: {e}", exc_info=True)
+            self.logger().error(f"Order cancellation failed: {e}")
 
     def did_fill_order(self, event: OrderFilledEvent):
         msg = f"{event.trade_type.name} {round(event.amount, 2)} {event.trading_pair} at {round(event.price, 2)}"
@@ -194,10 +285,7 @@ class PMMCandles(ScriptStrategyBase):
         self.notify_hb_app_with_timestamp(msg)
         
         try:
-            if event.trade_type == TradeType.SELL:
-                self.total_profit += Decimal(str(event.amount)) * Decimal(str(event.price))
-            else:
-                self.total_profit -= Decimal(str(event.amount)) * Decimal(str(event.price))
+            self.total_profit += self._SIGN[event.trade_type] * event.amount * event.price
         except Exception as e:
             self.logger().error(f"Profit tracking failed: {e}", exc_info=True)
 
@@ -206,33 +294,47 @@ class PMMCandles(ScriptStrategyBase):
             return "Market connectors are not ready."
         
         lines = []
-        
-        # Balances
-        try:
-            balance_df = self.get_balance_df()
-            lines.extend(["", "  Balances:"] + ["    " + line for line in balance_df.to_string(index=False).split("\n")])
-        except Exception:
-            lines.extend(["", "  Error getting balance information"])
 
-        # Orders
-        try:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
-        except ValueError:
-            lines.extend(["", "  No active orders"])
-        except Exception:
-            lines.extend(["", "  Error getting order information"])
+        # Balances and orders are built from connector state, so reuse them across rapid UI refreshes
+        if self.current_timestamp - self._status_cache.get("ts", -1) < self.status_cache_ttl:
+            lines.extend(self._status_cache["lines"])
+        else:
+            section = []
+
+            # Balances
+            try:
+                balance_df = self.get_balance_df()
+                section.extend(["", "  Balances:", textwrap.indent(balance_df.to_string(index=False), "    ")])
+            except Exception:
+                section.extend(["", "  Error getting balance information"])
+
+            # Orders
+            try:
+                df = self.active_orders_df()
+                section.extend(["", "  Orders:", textwrap.indent(df.to_string(index=False), "    ")])
+            except ValueError:
+                section.extend(["", "  No active orders"])
+            except Exception:
+                section.extend(["", "  Error getting order information"])
+
+            self._status_cache = {"ts": self.current_timestamp, "lines": section}
+            lines.extend(section)
 
         # stats for Profits
-        lines.extend([f"\n  Total Profit: {float(self.total_profit):.4f} {self.trading_pair.split('-')[1]}"])
+        lines.extend([f"\n  Total Profit: {float(self.total_profit):.4f} {self.quote_asset}"])
 
         # Candles
         lines.extend(["\n----------------------------------------------------------------------"])
         try:
-            candles_df = self.get_candles_with_features()
-            if candles_df is not None:
+            features = self.get_candles_with_features()
+            if features is not None:
+                # Attach the indicators out of place, only to the rows being displayed
+                display_df = features.candles_df.tail(self.candles_length).assign(**{
+                    f"RSI_{self.candles_length}": features.rsi[-self.candles_length:],
+                    f"SMA_{self.candles_length}": features.sma[-self.candles_length:],
+                })
                 lines.extend([f"  Candles: {self.candles.name} | Interval: {self.candles.interval}", ""])
-                lines.extend(["    " + line for line in candles_df.tail(self.candles_length).iloc[::-1].to_string(index=False).split("\n")])
+                lines.append(textwrap.indent(display_df.iloc[::-1].to_string(index=False), "    "))
             else:
                 lines.extend(["  Candles data not ready yet"])
         except Exception: